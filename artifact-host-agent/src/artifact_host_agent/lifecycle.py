@@ -2,7 +2,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from .web_server import ArtifactWebServer, set_web_server
+from .web_server import ArtifactWebServer, DEFAULT_BLOB_THRESHOLD, set_web_server
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,8 @@ def init_function(host_component: Any, config: Optional[Dict[str, Any]] = None)
             - host: Host to bind to (default: 127.0.0.1)
             - host_directory: Directory to serve files from (default: ./hosted_files)
             - base_url: Custom base URL for proxies/firewalls (optional)
+            - blob_threshold: Files smaller than this many bytes are stored in one
+              aggregated blob file (default: 0, every file is stored separately)
     """
     logger.info("[ArtifactHost:init] Starting artifact hosting web server")
 
@@ -29,6 +31,7 @@ def init_function(host_component: Any, config: Optional[Dict[str, Any]] = None)
     port = current_config.get("port", 8080)
     host = current_config.get("host", "127.0.0.1")
     host_directory = current_config.get("host_directory", "./hosted_files")
+    blob_threshold = current_config.get("blob_threshold", DEFAULT_BLOB_THRESHOLD)
 
     # Convert host_directory to Path
     host_dir_path = Path(host_directory)
@@ -43,7 +46,8 @@ def init_function(host_component: Any, config: Optional[Dict[str, Any]] = None)
         web_server = ArtifactWebServer(
             host_directory=host_dir_path,
             port=port,
-            host=host
+            host=host,
+            blob_threshold=blob_threshold
         )
 
         web_server.start()
@@ -1,18 +1,118 @@
 import logging
 import asyncio
+import atexit
+import functools
 import inspect
+import os
 import re
-import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from google.adk.tools import ToolContext
 from solace_agent_mesh.agent.utils.context_helpers import get_original_session_id
 
+from .uring_writer import get_uring_writer
 from .web_server import get_web_server
 
 logger = logging.getLogger(__name__)
 
+# Default lifetime (seconds) of cached "latest version" lookups; 0 disables the
+# cache, since a cached version hides versions saved after it (e.g. re-hosting
+# an edited file would serve the previous content until the entry expires)
+DEFAULT_VERSION_CACHE_TTL = 0.0
+
+# Module-level cache of latest artifact versions:
+# (app_name, user_id, session_id, filename) -> (version, expires_at)
+_latest_version_cache: Dict[Tuple[str, str, str, str], Tuple[int, float]] = {}
+_LATEST_VERSION_CACHE_MAX_ENTRIES = 1024
+
+# Written files larger than this are dropped from the page cache
+_FADVISE_THRESHOLD = 1 << 20
+
+# Maximum bytes handed to a single os.write call
+_WRITE_CHUNK_SIZE = 1 << 20
+
+# Dedicated thread pool for file writes and synchronous artifact service calls,
+# so hosting doesn't compete with other users of the loop's default executor
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SAM_IO_THREADS", "16")), thread_name_prefix="sam-io"
+)
+atexit.register(_IO_POOL.shutdown, wait=False)
+
+# Module-level cache of whether artifact service methods are coroutine functions
+_is_async_cache: Dict[Any, bool] = {}
+
+
+def _ctx_parts(tool_context: ToolContext) -> Tuple[str, str, str, Any]:
+    """
+    Extract app name, user ID, session ID and artifact service from a tool context.
+
+    Raises:
+        ValueError: If the invocation context or any of the parts is missing
+    """
+    inv_context = tool_context._invocation_context
+    if not inv_context:
+        raise ValueError("InvocationContext is not available.")
+
+    app_name = getattr(inv_context, "app_name", None)
+    user_id = getattr(inv_context, "user_id", None)
+    session_id = get_original_session_id(inv_context)
+    artifact_service = getattr(inv_context, "artifact_service", None)
+
+    if not (app_name and user_id and session_id and artifact_service):
+        missing_parts = [
+            part
+            for part, val in (
+                ("app_name", app_name),
+                ("user_id", user_id),
+                ("session_id", session_id),
+                ("artifact_service", artifact_service),
+            )
+            if not val
+        ]
+        raise ValueError(f"Missing required context parts: {', '.join(missing_parts)}")
+
+    return app_name, user_id, session_id, artifact_service
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_name_version(artifact_filename: str) -> Tuple[str, Optional[int]]:
+    """
+    Split "name:version" into the filename and optional integer version.
+
+    A suffix that is not an integer is treated as part of the filename.
+
+    Args:
+        artifact_filename: Artifact filename with optional version (e.g., "photo.jpg:2")
+
+    Returns:
+        Tuple of (filename, version or None)
+    """
+    filename_base, sep, version_str = artifact_filename.rpartition(":")
+    if not sep:
+        return artifact_filename, None
+    if not version_str:
+        return filename_base, None
+    try:
+        return filename_base, int(version_str)
+    except ValueError:
+        return artifact_filename, None
+
+
+def _hosted_filename(filename_base: str, custom_filename: Optional[str]) -> str:
+    """
+    Choose the name an artifact is hosted under.
+
+    A custom filename without an extension takes the original file's extension.
+    """
+    if not custom_filename:
+        return filename_base
+    if '.' not in custom_filename:
+        return custom_filename + os.path.splitext(filename_base)[1]
+    return custom_filename
+
 
 def _extract_artifact_references(html_content: str) -> List[str]:
     """
@@ -34,7 +134,7 @@ def _extract_artifact_references(html_content: str) -> List[str]:
     filenames = [match.strip() for match in matches]
     unique_filenames = list(dict.fromkeys(filenames))  # Preserve order while removing duplicates
 
-    logger.debug(f"[ArtifactHost] Extracted {len(unique_filenames)} artifact references: {unique_filenames}")
+    logger.debug("[ArtifactHost] Extracted %s artifact references: %s", len(unique_filenames), unique_filenames)
     return unique_filenames
 
 
@@ -65,6 +165,137 @@ def _replace_artifact_references(html_content: str, filename_map: Dict[str, str]
     return updated_html
 
 
+def _is_async(method: Any) -> bool:
+    """
+    Return whether a (bound) method is a coroutine function, caching the result.
+
+    Bound methods are recreated on every attribute access, so the cache is keyed
+    by the underlying function, which lives as long as the service class.
+    """
+    func = getattr(method, "__func__", method)
+    is_async = _is_async_cache.get(func)
+    if is_async is None:
+        is_async = _is_async_cache[func] = inspect.iscoroutinefunction(method)
+    return is_async
+
+
+async def _run_io(func: Any, *args, **kwargs) -> Any:
+    """Run a blocking function on the dedicated I/O thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_POOL, functools.partial(func, *args, **kwargs))
+
+
+async def _call_artifact_method(method: Any, **kwargs) -> Any:
+    """Call an artifact service method, running it in a thread if it is synchronous."""
+    if _is_async(method):
+        return await method(**kwargs)
+    return await _run_io(method, **kwargs)
+
+
+async def _resolve_and_load(
+    artifact_service: Any,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    filename_base: str,
+    version_to_load: Optional[int],
+    version_cache_ttl: float = DEFAULT_VERSION_CACHE_TTL,
+    speculative_load: bool = True
+) -> Tuple[int, Any]:
+    """
+    Resolve the artifact version to load and load it.
+
+    When no version is given the latest one is used. If version_cache_ttl is
+    positive, the latest version is remembered for that many seconds so repeated
+    loads of the same artifact skip the list_versions round-trip; versions saved
+    in the meantime are not seen until the entry expires. If a cached version can
+    no longer be loaded the entry is dropped and the versions are listed again.
+    The cache is disabled by default.
+
+    With speculative_load, a cache miss issues list_versions and a latest-version
+    load (version=None) concurrently, so resolving the latest version costs one
+    round-trip instead of two. The speculatively loaded part is only used if it
+    reports its own version and that matches the listed maximum; otherwise (a
+    save raced the two calls, the part carries no version, or the backend cannot
+    load with version=None) the listed maximum version is loaded explicitly, so
+    the returned version always describes the returned content.
+
+    Returns:
+        Tuple of (loaded version, artifact part)
+
+    Raises:
+        FileNotFoundError: If the artifact or its content does not exist
+    """
+    load_artifact_method = getattr(artifact_service, "load_artifact")
+    cache_key = (app_name, user_id, session_id, filename_base)
+
+    if version_to_load is None and version_cache_ttl > 0:
+        cached = _latest_version_cache.get(cache_key)
+        if cached is not None:
+            cached_version, expires_at = cached
+            if expires_at > time.monotonic():
+                try:
+                    artifact = await _call_artifact_method(
+                        load_artifact_method, app_name=app_name, user_id=user_id,
+                        session_id=session_id, filename=filename_base, version=cached_version
+                    )
+                except FileNotFoundError:
+                    artifact = None
+                if artifact and artifact.inline_data:
+                    return cached_version, artifact
+            _latest_version_cache.pop(cache_key, None)
+
+    # Get latest version if not specified
+    artifact = None
+    if version_to_load is None:
+        list_call = _call_artifact_method(
+            getattr(artifact_service, "list_versions"), app_name=app_name, user_id=user_id,
+            session_id=session_id, filename=filename_base
+        )
+        if speculative_load:
+            versions, artifact = await asyncio.gather(
+                list_call,
+                _call_artifact_method(
+                    load_artifact_method, app_name=app_name, user_id=user_id,
+                    session_id=session_id, filename=filename_base, version=None
+                ),
+                return_exceptions=True
+            )
+            if isinstance(versions, BaseException):
+                raise versions
+            if isinstance(artifact, BaseException):
+                logger.debug("[ArtifactHost] Speculative load of '%s' failed: %s", filename_base, artifact)
+                artifact = None
+        else:
+            versions = await list_call
+        if not versions:
+            raise FileNotFoundError(f"Artifact '{filename_base}' not found.")
+        version_to_load = max(versions)
+
+        if version_cache_ttl > 0:
+            now = time.monotonic()
+            if len(_latest_version_cache) >= _LATEST_VERSION_CACHE_MAX_ENTRIES:
+                for key in [k for k, (_, exp) in _latest_version_cache.items() if exp <= now]:
+                    del _latest_version_cache[key]
+            _latest_version_cache[cache_key] = (version_to_load, now + version_cache_ttl)
+
+    if artifact and artifact.inline_data and getattr(artifact, "version", None) == version_to_load:
+        return version_to_load, artifact
+
+    logger.debug("[ArtifactHost] Loading artifact '%s' version %s", filename_base, version_to_load)
+
+    # Load artifact
+    artifact = await _call_artifact_method(
+        load_artifact_method, app_name=app_name, user_id=user_id,
+        session_id=session_id, filename=filename_base, version=version_to_load
+    )
+
+    if not artifact or not artifact.inline_data:
+        raise FileNotFoundError(f"Content for '{filename_base}' v{version_to_load} not found.")
+
+    return version_to_load, artifact
+
+
 async def _host_single_artifact(
     artifact_filename: str,
     custom_filename: Optional[str],
@@ -73,7 +304,10 @@ async def _host_single_artifact(
     session_id: str,
     artifact_service: Any,
     web_server: Any,
-    base_url: Optional[str] = None
+    base_url: Optional[str] = None,
+    version_cache_ttl: float = DEFAULT_VERSION_CACHE_TTL,
+    speculative_load: bool = True,
+    use_uring: bool = False
 ) -> Dict[str, Any]:
     """
     Helper function to host a single artifact.
@@ -84,61 +318,23 @@ async def _host_single_artifact(
 
     try:
         # Parse artifact filename and version
-        parts = artifact_filename.rsplit(":", 1)
-        filename_base = parts[0]
-        version_str = parts[1] if len(parts) > 1 else None
-        version_to_load = int(version_str) if version_str else None
-
-        # Get latest version if not specified
-        if version_to_load is None:
-            list_versions_method = getattr(artifact_service, "list_versions")
-            if inspect.iscoroutinefunction(list_versions_method):
-                versions = await list_versions_method(
-                    app_name=app_name, user_id=user_id, session_id=session_id, filename=filename_base
-                )
-            else:
-                versions = await asyncio.to_thread(
-                    list_versions_method, app_name=app_name, user_id=user_id,
-                    session_id=session_id, filename=filename_base
-                )
-            if not versions:
-                raise FileNotFoundError(f"Artifact '{filename_base}' not found.")
-            version_to_load = max(versions)
-
-        logger.debug(f"{log_identifier} Loading artifact version {version_to_load}")
-
-        # Load artifact
-        load_artifact_method = getattr(artifact_service, "load_artifact")
-        if inspect.iscoroutinefunction(load_artifact_method):
-            artifact = await load_artifact_method(
-                app_name=app_name, user_id=user_id, session_id=session_id,
-                filename=filename_base, version=version_to_load
-            )
-        else:
-            artifact = await asyncio.to_thread(
-                load_artifact_method, app_name=app_name, user_id=user_id,
-                session_id=session_id, filename=filename_base, version=version_to_load
-            )
+        filename_base, version_to_load = _parse_name_version(artifact_filename)
 
-        if not artifact or not artifact.inline_data:
-            raise FileNotFoundError(f"Content for '{filename_base}' v{version_to_load} not found.")
+        # Resolve version (latest if not specified) and load artifact
+        version_to_load, artifact = await _resolve_and_load(
+            artifact_service, app_name, user_id, session_id, filename_base,
+            version_to_load, version_cache_ttl, speculative_load
+        )
 
         artifact_bytes = artifact.inline_data.data
-        logger.debug(f"{log_identifier} Loaded artifact: {len(artifact_bytes)} bytes")
-
-        # Determine hosted filename
-        hosted_filename = custom_filename if custom_filename else filename_base
+        logger.debug("%s Loaded artifact: %s bytes", log_identifier, len(artifact_bytes))
 
-        # Ensure filename has extension
-        if custom_filename and '.' not in custom_filename and '.' in filename_base:
-            extension = Path(filename_base).suffix
-            hosted_filename = f"{custom_filename}{extension}"
+        hosted_filename = _hosted_filename(filename_base, custom_filename)
 
         # Write artifact to web server directory
-        hosted_path = web_server.host_directory / hosted_filename
-        await asyncio.to_thread(_write_file, hosted_path, artifact_bytes)
+        await _write_hosted_file(web_server, hosted_filename, artifact_bytes, use_uring)
 
-        logger.info(f"{log_identifier} Artifact written to {hosted_path}")
+        logger.info("%s Artifact written as %s", log_identifier, hosted_filename)
 
         # Generate URL
         url = web_server.get_url(hosted_filename, base_url)
@@ -152,7 +348,7 @@ async def _host_single_artifact(
         }
 
     except Exception as e:
-        logger.error(f"{log_identifier} Failed to host: {e}")
+        logger.error("%s Failed to host: %s", log_identifier, e)
         return {
             "status": "error",
             "artifact_filename": artifact_filename,
@@ -178,21 +374,29 @@ async def host_artifact(
         tool_context: Framework context for accessing artifact service
         tool_config: Optional configuration:
             - base_url: Custom base URL for generated URLs (for firewall/proxy scenarios)
+            - version_cache_ttl: Seconds to reuse a looked-up latest version before
+              listing versions again (default: 0, disabled); newer versions saved
+              within that window are not hosted until it expires
+            - speculative_load: Load the latest version concurrently with listing
+              versions (default: True); disable for backends that require an
+              explicit version
+            - use_uring: Write hosted files through a shared io_uring (Linux, requires
+              the optional liburing package; default: False)
 
     Returns:
         Dictionary with status, message, hosted filename, and URL
     """
     log_identifier = f"[ArtifactHost:host_artifact:{artifact_filename}]"
-    logger.info(f"{log_identifier} Hosting artifact")
+    logger.info("%s Hosting artifact", log_identifier)
 
     if not tool_context:
-        logger.error(f"{log_identifier} ToolContext is missing.")
+        logger.error("%s ToolContext is missing.", log_identifier)
         return {"status": "error", "message": "ToolContext is required"}
 
     # Get web server instance
     web_server = get_web_server()
     if not web_server:
-        logger.error(f"{log_identifier} Web server is not initialized")
+        logger.error("%s Web server is not initialized", log_identifier)
         return {
             "status": "error",
             "message": "Web server is not running. Please check agent configuration."
@@ -200,73 +404,28 @@ async def host_artifact(
 
     try:
         # Extract invocation context
-        inv_context = tool_context._invocation_context
-        if not inv_context:
-            raise ValueError("InvocationContext is not available.")
-
-        app_name = getattr(inv_context, "app_name", None)
-        user_id = getattr(inv_context, "user_id", None)
-        session_id = get_original_session_id(inv_context)
-        artifact_service = getattr(inv_context, "artifact_service", None)
-
-        if not all([app_name, user_id, session_id, artifact_service]):
-            raise ValueError("Missing required context parts")
+        app_name, user_id, session_id, artifact_service = _ctx_parts(tool_context)
 
         # Parse artifact filename and version
-        parts = artifact_filename.rsplit(":", 1)
-        filename_base = parts[0]
-        version_str = parts[1] if len(parts) > 1 else None
-        version_to_load = int(version_str) if version_str else None
-
-        # Get latest version if not specified
-        if version_to_load is None:
-            list_versions_method = getattr(artifact_service, "list_versions")
-            if inspect.iscoroutinefunction(list_versions_method):
-                versions = await list_versions_method(
-                    app_name=app_name, user_id=user_id, session_id=session_id, filename=filename_base
-                )
-            else:
-                versions = await asyncio.to_thread(
-                    list_versions_method, app_name=app_name, user_id=user_id,
-                    session_id=session_id, filename=filename_base
-                )
-            if not versions:
-                raise FileNotFoundError(f"Artifact '{filename_base}' not found.")
-            version_to_load = max(versions)
-
-        logger.debug(f"{log_identifier} Loading artifact version {version_to_load}")
-
-        # Load artifact
-        load_artifact_method = getattr(artifact_service, "load_artifact")
-        if inspect.iscoroutinefunction(load_artifact_method):
-            artifact = await load_artifact_method(
-                app_name=app_name, user_id=user_id, session_id=session_id,
-                filename=filename_base, version=version_to_load
-            )
-        else:
-            artifact = await asyncio.to_thread(
-                load_artifact_method, app_name=app_name, user_id=user_id,
-                session_id=session_id, filename=filename_base, version=version_to_load
-            )
-
-        if not artifact or not artifact.inline_data:
-            raise FileNotFoundError(f"Content for '{filename_base}' v{version_to_load} not found.")
-
-        artifact_bytes = artifact.inline_data.data
-        logger.debug(f"{log_identifier} Loaded artifact: {len(artifact_bytes)} bytes")
-
-        # Determine hosted filename
-        hosted_filename = custom_filename if custom_filename else filename_base
-
-        # Ensure filename has extension
-        if custom_filename and '.' not in custom_filename and '.' in filename_base:
-            # Preserve original extension if custom name doesn't have one
-            extension = Path(filename_base).suffix
-            hosted_filename = f"{custom_filename}{extension}"
+        filename_base, version_to_load = _parse_name_version(artifact_filename)
 
         # Get configuration
         current_tool_config = tool_config if tool_config is not None else {}
         base_url = current_tool_config.get("base_url")
+        version_cache_ttl = current_tool_config.get("version_cache_ttl", DEFAULT_VERSION_CACHE_TTL)
+        speculative_load = current_tool_config.get("speculative_load", True)
+        use_uring = current_tool_config.get("use_uring", False)
+
+        # Resolve version (latest if not specified) and load artifact
+        version_to_load, artifact = await _resolve_and_load(
+            artifact_service, app_name, user_id, session_id, filename_base,
+            version_to_load, version_cache_ttl, speculative_load
+        )
+
+        artifact_bytes = artifact.inline_data.data
+        logger.debug("%s Loaded artifact: %s bytes", log_identifier, len(artifact_bytes))
+
+        hosted_filename = _hosted_filename(filename_base, custom_filename)
 
         # Check if this is an HTML file - if so, process artifact references
         referenced_artifacts = []
@@ -281,12 +440,15 @@ async def host_artifact(
                 referenced_filenames = _extract_artifact_references(html_content)
 
                 if referenced_filenames:
-                    logger.info(f"{log_identifier} Found {len(referenced_filenames)} artifact references in HTML: {referenced_filenames}")
+                    logger.info(
+                        "%s Found %s artifact references in HTML: %s",
+                        log_identifier, len(referenced_filenames), referenced_filenames
+                    )
 
                     # Host each referenced artifact
                     filename_map = {}
                     for ref_filename in referenced_filenames:
-                        logger.info(f"{log_identifier} Hosting referenced artifact: {ref_filename}")
+                        logger.info("%s Hosting referenced artifact: %s", log_identifier, ref_filename)
                         result = await _host_single_artifact(
                             artifact_filename=ref_filename,
                             custom_filename=None,
@@ -295,7 +457,10 @@ async def host_artifact(
                             session_id=session_id,
                             artifact_service=artifact_service,
                             web_server=web_server,
-                            base_url=base_url
+                            base_url=base_url,
+                            version_cache_ttl=version_cache_ttl,
+                            speculative_load=speculative_load,
+                            use_uring=use_uring
                         )
 
                         if result["status"] == "success":
@@ -305,31 +470,33 @@ async def host_artifact(
                                 "hosted_filename": result["hosted_filename"],
                                 "url": result["url"]
                             })
-                            logger.info(f"{log_identifier} Successfully hosted {ref_filename} as {result['hosted_filename']}")
+                            logger.info("%s Successfully hosted %s as %s", log_identifier, ref_filename, result['hosted_filename'])
                         else:
-                            logger.warning(f"{log_identifier} Failed to host {ref_filename}: {result.get('error')}")
+                            logger.warning("%s Failed to host %s: %s", log_identifier, ref_filename, result.get('error'))
 
                     # Replace artifact references in HTML with regular filenames
                     if filename_map:
                         updated_html = _replace_artifact_references(html_content, filename_map)
                         artifact_bytes = updated_html.encode('utf-8')
-                        logger.info(f"{log_identifier} Replaced {len(filename_map)} artifact references in HTML")
+                        logger.info("%s Replaced %s artifact references in HTML", log_identifier, len(filename_map))
 
             except UnicodeDecodeError:
-                logger.warning(f"{log_identifier} Could not decode HTML content as UTF-8, skipping artifact reference processing")
+                logger.warning(
+                    "%s Could not decode HTML content as UTF-8, skipping artifact reference processing",
+                    log_identifier
+                )
             except Exception as e:
-                logger.warning(f"{log_identifier} Error processing HTML artifact references: {e}")
+                logger.warning("%s Error processing HTML artifact references: %s", log_identifier, e)
 
         # Write artifact to web server directory
-        hosted_path = web_server.host_directory / hosted_filename
-        await asyncio.to_thread(_write_file, hosted_path, artifact_bytes)
+        await _write_hosted_file(web_server, hosted_filename, artifact_bytes, use_uring)
 
-        logger.info(f"{log_identifier} Artifact written to {hosted_path}")
+        logger.info("%s Artifact written as %s", log_identifier, hosted_filename)
 
         # Generate URL
         url = web_server.get_url(hosted_filename, base_url)
 
-        logger.info(f"{log_identifier} Artifact hosted successfully at {url}")
+        logger.info("%s Artifact hosted successfully at %s", log_identifier, url)
 
         result = {
             "status": "success",
@@ -348,20 +515,78 @@ async def host_artifact(
         return result
 
     except FileNotFoundError as e:
-        logger.warning(f"{log_identifier} File not found: {e}")
+        logger.warning("%s File not found: %s", log_identifier, e)
         return {"status": "error", "message": str(e)}
     except Exception as e:
-        logger.exception(f"{log_identifier} Unexpected error: {e}")
+        logger.exception("%s Unexpected error: %s", log_identifier, e)
         return {"status": "error", "message": f"An unexpected error occurred: {e}"}
 
 
-def _write_file(path: Path, content: bytes) -> None:
+async def _write_hosted_file(
+    web_server: Any,
+    hosted_filename: str,
+    content: bytes,
+    use_uring: bool = False
+) -> None:
+    """
+    Write a hosted file into the web server's hosting directory.
+
+    Files below the web server's blob threshold are appended to its aggregated
+    blob, which avoids creating an inode per small artifact. Larger files are
+    written separately, through io_uring when enabled and available, falling
+    back to _write_file on the I/O thread pool when io_uring is disabled,
+    liburing is not installed, or the kernel does not support it.
+    """
+    if len(content) < web_server.blob_threshold:
+        offset, length = await _run_io(web_server.append_blob, hosted_filename, content)
+        logger.debug("[ArtifactHost] Stored %s in blob at offset %s (%s bytes)", hosted_filename, offset, length)
+        return
+
+    await _run_io(web_server.forget_blob, hosted_filename)
+    path = web_server.host_directory / hosted_filename
+    writer = get_uring_writer() if use_uring else None
+    if writer is None:
+        await _run_io(_write_file, path, content)
+        return
+
+    # Truncating a large existing file can block, so open it off the event loop
+    fd = await _run_io(os.open, str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = await writer.write(fd, bytes(content)) if content else 0
+        if written < len(content):
+            await _run_io(_pwrite_all, fd, content, written)
+    finally:
+        os.close(fd)
+
+
+def _pwrite_all(fd: int, content: bytes, offset: int) -> None:
+    """Write content from offset to the end at the matching file position (synchronous)."""
+    view = memoryview(content)
+    while offset < len(view):
+        offset += os.pwrite(fd, view[offset:offset + _WRITE_CHUNK_SIZE], offset)
+
+
+def _write_file(path: Path, content: bytes, chunk_size: int = _WRITE_CHUNK_SIZE) -> None:
     """
     Write content to a file (synchronous).
 
+    Writes straight to the file descriptor in chunk_size slices of a memoryview,
+    bypassing Python's buffered writer without copying the content. Large
+    payloads are then advised out of the page cache, since the web server only
+    reads them back occasionally.
+
     Args:
         path: Path to write to
         content: Content bytes
+        chunk_size: Maximum bytes per write call (default: 1 MiB)
     """
-    with open(path, 'wb') as f:
-        f.write(content)
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(content)
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:written + chunk_size])
+        if len(view) > _FADVISE_THRESHOLD and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import os
+import queue
+import threading
+from typing import Dict, Optional, Tuple
+
+try:
+    import liburing
+except ImportError:  # Optional dependency: pip install artifact_host_agent[uring]
+    liburing = None
+
+logger = logging.getLogger(__name__)
+
+# Global writer instance
+_uring_writer_instance = None
+_uring_writer_lock = threading.Lock()
+_uring_writer_failed = False
+
+
+class UringWriter:
+    """
+    Batches file writes through a single shared io_uring.
+
+    One daemon thread owns the ring. Callers on any event loop queue writes with
+    `write()`; the thread prepares up to `max_batch` of them per submit call and
+    resolves each caller's future as its completion arrives, so many writes can
+    be in flight without tying up one pool thread per write.
+    """
+
+    def __init__(self, entries: int = 256, max_batch: int = 32):
+        """
+        Initialize the ring and start the submission thread.
+
+        Args:
+            entries: Submission queue size of the ring (default: 256)
+            max_batch: Maximum writes prepared per submit call (default: 32)
+
+        Raises:
+            RuntimeError: If liburing is not installed
+            OSError: If the kernel refuses to set up the ring
+        """
+        if liburing is None:
+            raise RuntimeError("liburing is not installed")
+
+        self._max_batch = min(max_batch, entries)
+        self._queue: queue.Queue = queue.Queue()
+        # Set once the submission thread has died; guarded by _failed_lock so no
+        # write can be queued after the thread has drained the queue
+        self.failed: Optional[Exception] = None
+        self._failed_lock = threading.Lock()
+        self._ring = liburing.Ring()
+        liburing.io_uring_queue_init(entries, self._ring, 0)
+
+        self._thread = threading.Thread(target=self._run, name="sam-uring", daemon=True)
+        self._thread.start()
+        logger.info("[UringWriter] Started io_uring writer with %s entries", entries)
+
+    async def write(self, fd: int, data: bytes, offset: int = 0) -> int:
+        """
+        Write data to fd at offset through the ring.
+
+        Returns:
+            Number of bytes written (may be short, like os.pwrite)
+
+        Raises:
+            OSError: If the write fails
+            RuntimeError: If the submission thread has died
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._failed_lock:
+            if self.failed is not None:
+                raise RuntimeError("io_uring writer has stopped") from self.failed
+            self._queue.put((fd, data, offset, loop, future))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The kernel may still be using fd; don't hand control back to a
+            # caller that will close it until the write has completed.
+            await asyncio.wait([future])
+            raise
+
+    def _run(self) -> None:
+        cqe = liburing.Cqe()
+        # user_data -> (data, loop, future); holding data keeps the buffer alive until completion
+        in_flight: Dict[int, Tuple[bytes, asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        next_id = 0
+
+        try:
+            while True:
+                # Collect a batch; only block for new work when nothing is in flight
+                batch = []
+                while len(batch) < self._max_batch:
+                    try:
+                        batch.append(self._queue.get(block=not in_flight and not batch))
+                    except queue.Empty:
+                        break
+
+                for fd, data, offset, loop, future in batch:
+                    sqe = liburing.io_uring_get_sqe(self._ring)
+                    if sqe is None:
+                        # Ring is full: push the rest back and wait for completions first
+                        self._queue.put((fd, data, offset, loop, future))
+                        continue
+                    liburing.io_uring_prep_write(sqe, fd, data, offset)
+                    liburing.io_uring_sqe_set_data64(sqe, next_id)
+                    in_flight[next_id] = (data, loop, future)
+                    next_id += 1
+
+                if batch:
+                    liburing.io_uring_submit(self._ring)
+
+                if in_flight:
+                    # Reap completions one at a time: cqe[i] does not wrap around
+                    # the completion ring, so indexing past cqe[0] is not safe
+                    liburing.io_uring_wait_cqe(self._ring, cqe)
+                    while True:
+                        entry = cqe[0]
+                        _, loop, future = in_flight.pop(entry.user_data)
+                        loop.call_soon_threadsafe(_resolve, future, entry.res)
+                        liburing.io_uring_cqe_seen(self._ring, entry)
+                        try:
+                            liburing.io_uring_peek_cqe(self._ring, cqe)
+                        except BlockingIOError:
+                            break
+        except Exception as e:
+            logger.exception("[UringWriter] Submission thread failed: %s", e)
+            with self._failed_lock:
+                self.failed = e
+            for _, loop, future in in_flight.values():
+                loop.call_soon_threadsafe(_fail, future, e)
+            while True:
+                try:
+                    _, _, _, loop, future = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                loop.call_soon_threadsafe(_fail, future, e)
+        finally:
+            liburing.io_uring_queue_exit(self._ring)
+
+
+def _resolve(future: asyncio.Future, res: int) -> None:
+    """Complete a write future from a CQE result (negative results are -errno)."""
+    if future.done():
+        return
+    if res < 0:
+        future.set_exception(OSError(-res, os.strerror(-res)))
+    else:
+        future.set_result(res)
+
+
+def _fail(future: asyncio.Future, error: Exception) -> None:
+    if not future.done():
+        future.set_exception(error)
+
+
+def get_uring_writer() -> Optional[UringWriter]:
+    """
+    Get the global io_uring writer, creating it on first use.
+
+    Returns None if liburing is not installed, the kernel does not support
+    io_uring or the writer has failed, so callers can fall back to regular writes.
+    """
+    global _uring_writer_instance, _uring_writer_failed
+    if _uring_writer_instance is None and not _uring_writer_failed:
+        with _uring_writer_lock:
+            if _uring_writer_instance is None and not _uring_writer_failed:
+                try:
+                    _uring_writer_instance = UringWriter()
+                except Exception as e:
+                    _uring_writer_failed = True
+                    logger.warning("[UringWriter] io_uring unavailable, using regular writes: %s", e)
+    if _uring_writer_instance is not None and _uring_writer_instance.failed is not None:
+        return None
+    return _uring_writer_instance
@@ -1,11 +1,22 @@
+import io
+import json
 import logging
+import mimetypes
+import os
 import threading
 from pathlib import Path
-from typing import Optional
-from flask import Flask, send_from_directory, render_template_string
+from typing import Dict, Optional, Tuple
+from flask import Flask, Response, abort, request, send_from_directory, render_template_string
+from werkzeug.wsgi import wrap_file
 
 logger = logging.getLogger(__name__)
 
+# Small hosted files can be appended to one aggregated blob instead of separate
+# files; disabled by default (blob_threshold 0)
+BLOB_FILENAME = "hosted.blob"
+BLOB_INDEX_FILENAME = "hosted.blob.index"
+DEFAULT_BLOB_THRESHOLD = 0
+
 # Global web server instance
 _web_server_instance = None
 _server_thread = None
@@ -14,7 +25,13 @@ _server_thread = None
 class ArtifactWebServer:
     """Flask-based web server for hosting artifacts."""
 
-    def __init__(self, host_directory: Path, port: int = 8080, host: str = "127.0.0.1"):
+    def __init__(
+        self,
+        host_directory: Path,
+        port: int = 8080,
+        host: str = "127.0.0.1",
+        blob_threshold: int = DEFAULT_BLOB_THRESHOLD
+    ):
         """
         Initialize the artifact web server.
 
@@ -22,15 +39,24 @@ class ArtifactWebServer:
             host_directory: Directory containing files to serve
             port: Port to bind to (default: 8080)
             host: Host to bind to (default: 127.0.0.1)
+            blob_threshold: Files smaller than this many bytes are stored in the
+                aggregated blob rather than as separate files (default: 0, disabled)
         """
         self.host_directory = host_directory
         self.port = port
         self.host = host
+        self.blob_threshold = blob_threshold
         self.app = Flask(__name__)
         self.server_thread = None
 
+        # Aggregated blob state: filename -> (offset, length)
+        self._blob_lock = threading.Lock()
+        self._blob_fd: Optional[int] = None
+        self._blob_index: Dict[str, Tuple[int, int]] = {}
+
         # Ensure host directory exists
         self.host_directory.mkdir(parents=True, exist_ok=True)
+        self._load_blob_index()
 
         # Setup routes
         self._setup_routes()
@@ -43,17 +69,23 @@ class ArtifactWebServer:
         @self.app.route('/')
         def index():
             """Directory listing page."""
-            files = []
+            sizes = {}
             if self.host_directory.exists():
-                for file_path in sorted(self.host_directory.iterdir()):
-                    if file_path.is_file():
-                        size_bytes = file_path.stat().st_size
-                        size_mb = size_bytes / (1024 * 1024)
-                        files.append({
-                            'name': file_path.name,
-                            'size_bytes': size_bytes,
-                            'size_display': f"{size_mb:.2f} MB" if size_mb >= 1 else f"{size_bytes / 1024:.2f} KB"
-                        })
+                for file_path in self.host_directory.iterdir():
+                    if file_path.is_file() and file_path.name not in (BLOB_FILENAME, BLOB_INDEX_FILENAME):
+                        sizes[file_path.name] = file_path.stat().st_size
+            with self._blob_lock:
+                for name, (_, length) in self._blob_index.items():
+                    sizes[name] = length
+
+            files = []
+            for name, size_bytes in sorted(sizes.items()):
+                size_mb = size_bytes / (1024 * 1024)
+                files.append({
+                    'name': name,
+                    'size_bytes': size_bytes,
+                    'size_display': f"{size_mb:.2f} MB" if size_mb >= 1 else f"{size_bytes / 1024:.2f} KB"
+                })
 
             html = """
             <!DOCTYPE html>
@@ -142,8 +174,117 @@ class ArtifactWebServer:
         @self.app.route('/<path:filename>')
         def serve_file(filename):
             """Serve individual files."""
+            if filename in (BLOB_FILENAME, BLOB_INDEX_FILENAME):
+                abort(404)
+            with self._blob_lock:
+                entry = self._blob_index.get(filename)
+                blob_fd = self._blob_fd
+            if entry is not None and blob_fd is not None:
+                return self._blob_response(filename, blob_fd, *entry)
             return send_from_directory(self.host_directory, filename)
 
+    def _blob_response(self, filename: str, blob_fd: int, offset: int, length: int) -> Response:
+        """
+        Serve a file's region of the aggregated blob.
+
+        Like send_from_directory, the response supports Range, ETag and
+        conditional requests. send_file only knows the size of paths and
+        BytesIO objects, so the conditional handling is applied directly.
+        """
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        response = Response(
+            wrap_file(request.environ, _BlobRegion(blob_fd, offset, length)),
+            mimetype=mimetype,
+            direct_passthrough=True,
+        )
+        response.content_length = length
+        response.cache_control.no_cache = True
+        # Regions are never rewritten (re-hosting appends a new one), so the
+        # offset identifies the content
+        response.set_etag(f"blob-{offset}-{length}")
+        return response.make_conditional(request, accept_ranges=True, complete_length=length)
+
+    def _load_blob_index(self):
+        """Replay the blob index journal left by a previous run, if any."""
+        index_path = self.host_directory / BLOB_INDEX_FILENAME
+        if not index_path.exists():
+            return
+        with open(index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn final line from an interrupted write
+                if record.get("offset") is None:
+                    self._blob_index.pop(record["name"], None)
+                else:
+                    self._blob_index[record["name"]] = (record["offset"], record["length"])
+
+        # Drop entries the blob no longer covers (e.g. it was deleted or truncated);
+        # the tombstones keep them from matching data appended later
+        blob_path = self.host_directory / BLOB_FILENAME
+        blob_size = blob_path.stat().st_size if blob_path.exists() else 0
+        missing = [
+            name for name, (offset, length) in self._blob_index.items() if offset + length > blob_size
+        ]
+        for name in missing:
+            del self._blob_index[name]
+            self._journal({"name": name, "offset": None})
+        if missing:
+            logger.warning(
+                "[ArtifactWebServer] Ignoring %d blob index entries beyond the end of %s",
+                len(missing), BLOB_FILENAME
+            )
+
+        if self._blob_index:
+            self._open_blob()
+        logger.info("[ArtifactWebServer] Loaded %d blob entries", len(self._blob_index))
+
+    def _open_blob(self) -> int:
+        """Open the aggregated blob for appending and reading (caller holds the lock or is initializing)."""
+        if self._blob_fd is None:
+            self._blob_fd = os.open(
+                str(self.host_directory / BLOB_FILENAME), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644
+            )
+        return self._blob_fd
+
+    def _journal(self, record: Dict) -> None:
+        """Append a record to the blob index journal (caller holds the lock)."""
+        with open(self.host_directory / BLOB_INDEX_FILENAME, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+
+    def append_blob(self, filename: str, data: bytes) -> Tuple[int, int]:
+        """
+        Store a hosted file as a region of the aggregated blob (synchronous).
+
+        Any separate file with the same name is removed so the blob copy is served.
+
+        Args:
+            filename: Hosted filename
+            data: File content
+
+        Returns:
+            Tuple of (offset, length) of the file within the blob
+        """
+        with self._blob_lock:
+            fd = self._open_blob()
+            offset = os.fstat(fd).st_size
+            view = memoryview(data)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+            self._journal({"name": filename, "offset": offset, "length": len(view)})
+            self._blob_index[filename] = (offset, len(view))
+
+        (self.host_directory / filename).unlink(missing_ok=True)
+        return offset, len(view)
+
+    def forget_blob(self, filename: str) -> None:
+        """Drop a file from the aggregated blob index, e.g. when it is re-hosted as a separate file."""
+        with self._blob_lock:
+            if self._blob_index.pop(filename, None) is not None:
+                self._journal({"name": filename, "offset": None})
+
     def start(self):
         """Start the web server in a background thread."""
         if self.server_thread and self.server_thread.is_alive():
@@ -188,6 +329,43 @@ class ArtifactWebServer:
             return f"http://{self.host}:{self.port}/{filename}"
 
 
+class _BlobRegion(io.RawIOBase):
+    """Read-only, seekable view of one region of the aggregated blob."""
+
+    def __init__(self, fd: int, offset: int, length: int):
+        self._fd = fd
+        self._offset = offset
+        self._length = length
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, position: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            position += self._position
+        elif whence == io.SEEK_END:
+            position += self._length
+        self._position = max(0, min(position, self._length))
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._length - self._position)
+        if size <= 0:
+            return 0
+        # pread doesn't move the shared file offset, so concurrent requests are safe
+        data = os.pread(self._fd, size, self._offset + self._position)
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
 def get_web_server() -> Optional[ArtifactWebServer]:
     """Get the global web server instance."""
     return _web_server_instance
@@ -1,6 +1,8 @@
 import argparse
+import json
 import os
 import re
+import sys
 import traceback
 from typing import List, Tuple, Union, Dict, Any
 import time
@@ -103,7 +105,7 @@ def parse_args():
         "--txt_path",
         type=str,
         default="demo/text_examples/1p_vibevoice.txt",
-        help="Path to the txt file containing the script",
+        help="Path to the txt file containing the script, or '-' to read it from stdin",
     )
     parser.add_argument(
         "--speaker_name",
@@ -117,6 +119,12 @@ def parse_args():
         default="./outputs",
         help="Directory to save output audio files",
     )
+    parser.add_argument(
+        "--output_path",
+        type=str,
+        default=None,
+        help="Exact path of the output wav file (overrides --output_dir)",
+    )
     parser.add_argument(
         "--device",
         type=str,
@@ -129,77 +137,50 @@ def parse_args():
         default=1.5,
         help="CFG (Classifier-Free Guidance) scale for generation (default: 1.5)",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the model loaded and read JSON-line requests from stdin, writing one JSON-line response per request to stdout",
+    )
     
     return parser.parse_args()
 
-def main():
-    args = parse_args()
-
-    # Normalize potential 'mpx' typo to 'mps'
-    if args.device.lower() == "mpx":
-        print("Note: device 'mpx' detected, treating it as 'mps'.")
-        args.device = "mps"
-
-    # Validate mps availability if requested
-    if args.device == "mps" and not torch.backends.mps.is_available():
-        print("Warning: MPS not available. Falling back to CPU.")
-        args.device = "cpu"
-
-    print(f"Using device: {args.device}")
-
-    # Initialize voice mapper
-    voice_mapper = VoiceMapper()
-    
-    # Check if txt file exists
-    if not os.path.exists(args.txt_path):
-        print(f"Error: txt file not found: {args.txt_path}")
-        return
-    
-    # Read and parse txt file
-    print(f"Reading script from: {args.txt_path}")
-    with open(args.txt_path, 'r', encoding='utf-8') as f:
-        scripts = f.read().strip()
-    
-    if not scripts:
-        print("Error: No valid scripts found in the txt file")
-        return
-
-    full_script = scripts.replace("’", "'").replace('“', '"').replace('”', '"')
-
-    print(f"Loading processor & model from {args.model_path}")
-    processor = VibeVoiceStreamingProcessor.from_pretrained(args.model_path)
+def load_model(model_path: str, device: str):
+    """Load the processor and model onto the requested device."""
+    print(f"Loading processor & model from {model_path}")
+    processor = VibeVoiceStreamingProcessor.from_pretrained(model_path)
 
     # Decide dtype & attention implementation
-    if args.device == "mps":
+    if device == "mps":
         load_dtype = torch.float32  # MPS requires float32
         attn_impl_primary = "sdpa"  # flash_attention_2 not supported on MPS
-    elif args.device == "cuda":
+    elif device == "cuda":
         load_dtype = torch.bfloat16
         attn_impl_primary = "flash_attention_2"
     else:  # cpu
         load_dtype = torch.float32
         attn_impl_primary = "sdpa"
-    print(f"Using device: {args.device}, torch_dtype: {load_dtype}, attn_implementation: {attn_impl_primary}")
+    print(f"Using device: {device}, torch_dtype: {load_dtype}, attn_implementation: {attn_impl_primary}")
     # Load model with device-specific logic
     try:
-        if args.device == "mps":
+        if device == "mps":
             model = VibeVoiceStreamingForConditionalGenerationInference.from_pretrained(
-                args.model_path,
+                model_path,
                 torch_dtype=load_dtype,
                 attn_implementation=attn_impl_primary,
                 device_map=None,  # load then move
             )
             model.to("mps")
-        elif args.device == "cuda":
+        elif device == "cuda":
             model = VibeVoiceStreamingForConditionalGenerationInference.from_pretrained(
-                args.model_path,
+                model_path,
                 torch_dtype=load_dtype,
                 device_map="cuda",
                 attn_implementation=attn_impl_primary,
             )
         else:  # cpu
             model = VibeVoiceStreamingForConditionalGenerationInference.from_pretrained(
-                args.model_path,
+                model_path,
                 torch_dtype=load_dtype,
                 device_map="cpu",
                 attn_implementation=attn_impl_primary,
@@ -210,12 +191,12 @@ def main():
             print(traceback.format_exc())
             print("Error loading the model. Trying to use SDPA. However, note that only flash_attention_2 has been fully tested, and using SDPA may result in lower audio quality.")
             model = VibeVoiceStreamingForConditionalGenerationInference.from_pretrained(
-                args.model_path,
+                model_path,
                 torch_dtype=load_dtype,
-                device_map=(args.device if args.device in ("cuda", "cpu") else None),
+                device_map=(device if device in ("cuda", "cpu") else None),
                 attn_implementation='sdpa'
             )
-            if args.device == "mps":
+            if device == "mps":
                 model.to("mps")
         else:
             raise e
@@ -226,9 +207,17 @@ def main():
 
     if hasattr(model.model, 'language_model'):
        print(f"Language model attention: {model.model.language_model.config._attn_implementation}")
-    
-    target_device = args.device if args.device != "cpu" else "cpu"
-    voice_sample = voice_mapper.get_voice_path(args.speaker_name)
+
+    return processor, model
+
+
+def generate(processor, model, voice_mapper: VoiceMapper, device: str, script: str,
+             speaker_name: str, output_path: str, cfg_scale: float) -> None:
+    """Synthesize a script with an already loaded model and save it as a wav file."""
+    full_script = script.replace("’", "'").replace('“', '"').replace('”', '"')
+
+    target_device = device if device != "cpu" else "cpu"
+    voice_sample = voice_mapper.get_voice_path(speaker_name)
     all_prefilled_outputs = torch.load(voice_sample, map_location=target_device, weights_only=False)
 
     # Prepare inputs for the model
@@ -245,14 +234,14 @@ def main():
         if torch.is_tensor(v):
             inputs[k] = v.to(target_device)
 
-    print(f"Starting generation with cfg_scale: {args.cfg_scale}")
+    print(f"Starting generation with cfg_scale: {cfg_scale}")
 
     # Generate audio
     start_time = time.time()
     outputs = model.generate(
         **inputs,
         max_new_tokens=None,
-        cfg_scale=args.cfg_scale,
+        cfg_scale=cfg_scale,
         tokenizer=processor.tokenizer,
         generation_config={'do_sample': False},
         verbose=True,
@@ -284,9 +273,7 @@ def main():
     print(f"Total tokens: {output_tokens}")
 
     # Save output (processor handles device internally)
-    txt_filename = os.path.splitext(os.path.basename(args.txt_path))[0]
-    output_path = os.path.join(args.output_dir, f"{txt_filename}_generated.wav")
-    os.makedirs(args.output_dir, exist_ok=True)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
     
     processor.save_audio(
         outputs.speech_outputs[0], # First (and only) batch item
@@ -298,9 +285,8 @@ def main():
     print("\n" + "="*50)
     print("GENERATION SUMMARY")
     print("="*50)
-    print(f"Input file: {args.txt_path}")
     print(f"Output file: {output_path}")
-    print(f"Speaker names: {args.speaker_name}")
+    print(f"Speaker names: {speaker_name}")
     print(f"Prefilling text tokens: {input_tokens}")
     print(f"Generated speech tokens: {generated_tokens}")
     print(f"Total tokens: {output_tokens}")
@@ -310,5 +296,120 @@ def main():
     
     print("="*50)
 
+
+def serve(args, voice_mapper: VoiceMapper, protocol_out) -> None:
+    """
+    Keep the model loaded and handle requests until stdin is closed.
+
+    Each request is one JSON header line on stdin followed by text_length bytes
+    of UTF-8 text:
+        {"text_length": 11, "speaker_name": "Carter", "output_path": "/tmp/out.wav"}
+        Hello world
+    and gets exactly one JSON line back on stdout:
+        {"status": "success", "output_path": "..."} or {"status": "error", "message": "..."}
+
+    A header that cannot be parsed leaves the position of the next request
+    unknown, so it is answered with an error marked "fatal": true and the loop
+    exits; the client then starts a fresh worker.
+    """
+    processor, model = load_model(args.model_path, args.device)
+    stdin = sys.stdin.buffer
+
+    def respond(response: dict) -> None:
+        protocol_out.write(json.dumps(response) + "\n")
+        protocol_out.flush()
+
+    for line in iter(stdin.readline, b""):
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            text_length = request["text_length"]
+            if not isinstance(text_length, int) or text_length < 0:
+                raise ValueError(f"Invalid text_length: {text_length!r}")
+        except Exception as e:
+            print(traceback.format_exc())
+            respond({"status": "error", "message": f"Invalid request header: {type(e).__name__}: {e}", "fatal": True})
+            break
+
+        text_bytes = stdin.read(text_length)
+        if len(text_bytes) < text_length:
+            break  # stdin closed mid-request
+
+        try:
+            script = text_bytes.decode("utf-8").strip()
+            if not script:
+                raise ValueError("No valid script found in the request")
+            generate(
+                processor, model, voice_mapper, args.device, script,
+                request.get("speaker_name", args.speaker_name),
+                request["output_path"],
+                request.get("cfg_scale", args.cfg_scale),
+            )
+            response = {"status": "success", "output_path": request["output_path"]}
+        except Exception as e:
+            print(traceback.format_exc())
+            response = {"status": "error", "message": f"{type(e).__name__}: {e}"}
+        respond(response)
+
+
+def main():
+    args = parse_args()
+
+    if args.serve:
+        # Keep the original stdout for the protocol and send everything else
+        # (our prints, library output) to stderr so it can't corrupt responses.
+        protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+        sys.stdout.flush()
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    # Normalize potential 'mpx' typo to 'mps'
+    if args.device.lower() == "mpx":
+        print("Note: device 'mpx' detected, treating it as 'mps'.")
+        args.device = "mps"
+
+    # Validate mps availability if requested
+    if args.device == "mps" and not torch.backends.mps.is_available():
+        print("Warning: MPS not available. Falling back to CPU.")
+        args.device = "cpu"
+
+    print(f"Using device: {args.device}")
+
+    # Initialize voice mapper
+    voice_mapper = VoiceMapper()
+
+    if args.serve:
+        serve(args, voice_mapper, protocol_out)
+        return
+    
+    if args.txt_path == "-":
+        print("Reading script from stdin")
+        scripts = sys.stdin.buffer.read().decode('utf-8').strip()
+    else:
+        # Check if txt file exists
+        if not os.path.exists(args.txt_path):
+            print(f"Error: txt file not found: {args.txt_path}")
+            return
+
+        # Read and parse txt file
+        print(f"Reading script from: {args.txt_path}")
+        with open(args.txt_path, 'r', encoding='utf-8') as f:
+            scripts = f.read().strip()
+    
+    if not scripts:
+        print("Error: No valid scripts found in the txt file")
+        return
+
+    processor, model = load_model(args.model_path, args.device)
+
+    if args.output_path:
+        output_path = args.output_path
+    else:
+        txt_filename = os.path.splitext(os.path.basename(args.txt_path))[0]
+        output_path = os.path.join(args.output_dir, f"{txt_filename}_generated.wav")
+
+    generate(processor, model, voice_mapper, args.device, scripts,
+             args.speaker_name, output_path, args.cfg_scale)
+
 if __name__ == "__main__":
     main()
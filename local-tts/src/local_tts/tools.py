@@ -1,12 +1,22 @@
 import logging
 import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
 import os
+import shutil
 import tempfile
-import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from google.adk.tools import ToolContext
+from huggingface_hub import snapshot_download
 from solace_agent_mesh.agent.utils.artifact_helpers import (
     save_artifact_with_metadata,
     DEFAULT_SCHEMA_MAX_KEYS,
@@ -15,198 +25,558 @@ from solace_agent_mesh.agent.utils.context_helpers import get_original_session_i
 
 log = logging.getLogger(__name__)
 
-# Available voices
-AVAILABLE_VOICES = ["Carter", "Davis", "Emma", "Grace"]
+# Available voices by language and gender, matching voices/streaming_model/<lang>-<Name>_<gender>.pt
+VOICE_CATALOG = {
+    "en": {
+        "man": ("Carter", "Davis"),
+        "woman": ("Emma", "Grace"),
+    },
+}
+AVAILABLE_VOICES = frozenset(
+    voice for genders in VOICE_CATALOG.values() for voices in genders.values() for voice in voices
+)
+_VOICE_TO_LANG = {
+    voice: lang for lang, genders in VOICE_CATALOG.items() for voices in genders.values() for voice in voices
+}
 
+# Default VibeVoice model
+DEFAULT_MODEL = "microsoft/VibeVoice-Realtime-0.5B"
 
-async def text_to_speech(
-    text: str,
-    speaker_name: str = "Carter",
-    tool_context: Optional[ToolContext] = None,
-    tool_config: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
+# MIME type of the saved audio artifacts
+_MP3_MIME_TYPE = "audio/mpeg"
+
+
+async def _run_process(cmd: List[str], timeout: Optional[float] = None) -> Tuple[int, bytes, str]:
     """
-    Converts text to speech using VibeVoice TTS and saves the output as an MP3 artifact.
+    Run a command without blocking the event loop.
 
     Args:
-        text: The text to convert to speech
-        speaker_name: The voice to use (Carter, Davis, Emma, or Grace). Default: Carter
-        tool_context: The tool context from Solace Agent Mesh
-        tool_config: Additional tool configuration
+        cmd: Command and arguments
+        timeout: Seconds to wait before killing the process
 
     Returns:
-        A dictionary with status, message, and artifact information
+        Tuple of (return code, stdout bytes, decoded stderr)
+
+    Raises:
+        asyncio.TimeoutError: If the process does not finish within timeout
     """
-    plugin_name = "local-tts"
-    log_identifier = f"[{plugin_name}:text_to_speech]"
-    log.info(f"{log_identifier} Converting text to speech with speaker: {speaker_name}")
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout, stderr.decode("utf-8", errors="replace")
 
-    # Validate speaker
-    if speaker_name not in AVAILABLE_VOICES:
-        log.warning(f"{log_identifier} Invalid speaker '{speaker_name}', defaulting to Carter")
-        speaker_name = "Carter"
 
-    # Validate tool context
-    if not tool_context or not tool_context._invocation_context:
-        log.error(f"{log_identifier} ToolContext or InvocationContext is missing.")
-        return {
-            "status": "error",
-            "message": "ToolContext or InvocationContext is missing.",
-        }
+class _TTSWorker:
+    """
+    Long-lived inference process that keeps the VibeVoice model loaded.
+
+    The inference script is started once in ``--serve`` mode and requests are
+    exchanged over its stdin/stdout, so the model is loaded on the
+    first call only instead of on every call. Requests are serialized behind a
+    lock; if the process dies or a request times out it is restarted on the
+    next call.
+    """
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def _start(self) -> None:
+        plugin_dir = os.path.dirname(os.path.abspath(__file__))
+        inference_script = os.path.join(plugin_dir, "realtime_model_inference_from_file.py")
+        cmd = ["python", inference_script, "--serve", "--model_path", self.model_path]
+
+        log.info("[local-tts] Starting TTS worker: %s", ' '.join(cmd))
+        self._proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self._stderr_task = asyncio.create_task(self._drain_stderr(self._proc))
+
+    async def _drain_stderr(self, proc: asyncio.subprocess.Process) -> None:
+        """Forward worker output to the debug log so the pipe never fills up."""
+        async for line in proc.stderr:
+            log.debug("[local-tts:worker] %s", line.decode('utf-8', errors='replace').rstrip())
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+
+    async def synthesize(
+        self, text_bytes: bytes, speaker_name: str, output_path: str, timeout: float
+    ) -> Dict[str, Any]:
+        """
+        Generate speech for UTF-8 encoded text and write it to output_path as WAV.
+
+        The request is a JSON header line followed by the raw text bytes, so the
+        text is sent as already encoded rather than escaped into the JSON.
+
+        Returns:
+            The worker's response dictionary with 'status' and 'message' on error
+
+        Raises:
+            asyncio.TimeoutError: If the worker does not respond within timeout
+        """
+        async with self._lock:
+            if self._proc is None or self._proc.returncode is not None:
+                await self._start()
+
+            header = {
+                "text_length": len(text_bytes),
+                "speaker_name": speaker_name,
+                "output_path": output_path,
+            }
+            try:
+                self._proc.stdin.writelines((json.dumps(header).encode("utf-8"), b"\n", text_bytes))
+                await self._proc.stdin.drain()
+                line = await asyncio.wait_for(self._proc.stdout.readline(), timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                # The worker's state is unknown; a late response would be read
+                # by the next request, so start over with a fresh process.
+                self._stop()
+                raise
+            except (BrokenPipeError, ConnectionResetError):
+                line = b""
+
+            if not line:
+                self._stop()
+                return {"status": "error", "message": "TTS worker exited unexpectedly"}
+
+            response = json.loads(line)
+            if response.get("fatal"):
+                # The worker could not parse the request and is exiting; the
+                # next call starts a fresh one
+                self._stop()
+            return response
+
+
+# Module-level TTS workers, one per model path
+_workers: Dict[str, _TTSWorker] = {}
+
+# Default number of syntheses (worker request plus MP3 transcode) allowed at once
+DEFAULT_TTS_CONCURRENCY = int(os.getenv("SAM_TTS_CONCURRENCY", str(max(1, (os.cpu_count() or 2) // 2))))
+
+# Module-level semaphore bounding concurrent synthesis across all tools, sized on first use
+_tts_semaphore: Optional[asyncio.Semaphore] = None
+_tts_semaphore_limit: Optional[int] = None
+_tts_ignored_limits: Set[int] = set()
+
+
+def _get_worker(model_path: str) -> _TTSWorker:
+    """Return the TTS worker for a model, creating it on first use."""
+    worker = _workers.get(model_path)
+    if worker is None:
+        worker = _workers[model_path] = _TTSWorker(model_path)
+    return worker
+
+
+def _get_semaphore(limit: Optional[int] = None) -> asyncio.Semaphore:
+    """
+    Return the process-wide synthesis semaphore, creating it on first use.
+
+    It is sized by the limit passed on first use (tool_config max_concurrent_tts),
+    else DEFAULT_TTS_CONCURRENCY. A different limit requested later is ignored (with
+    one warning per value), so the total across tools stays bounded.
+    """
+    global _tts_semaphore, _tts_semaphore_limit
+    if _tts_semaphore is None:
+        _tts_semaphore_limit = max(1, limit if limit is not None else DEFAULT_TTS_CONCURRENCY)
+        _tts_semaphore = asyncio.Semaphore(_tts_semaphore_limit)
+    elif limit is not None and max(1, limit) != _tts_semaphore_limit and limit not in _tts_ignored_limits:
+        _tts_ignored_limits.add(limit)
+        log.warning(
+            "[local-tts] Ignoring max_concurrent_tts=%s; synthesis is already limited to %s",
+            limit, _tts_semaphore_limit,
+        )
+    return _tts_semaphore
+
+
+# Dedicated thread pool for blocking file and download work; synthesis itself
+# runs in the worker process and needs no threads here
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SAM_IO_THREADS", "16")), thread_name_prefix="sam-io"
+)
+atexit.register(_IO_POOL.shutdown, wait=False)
+
+# Process-wide temporary directory for generated audio; files inside it get
+# unique names from a counter and the whole directory is removed at exit
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="sam-tts-"))
+_TMP_COUNTER = itertools.count()
+atexit.register(shutil.rmtree, _TMP_DIR, ignore_errors=True)
+
+
+async def _run_io(func: Any, *args, **kwargs) -> Any:
+    """Run a blocking function on the dedicated I/O thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_POOL, functools.partial(func, *args, **kwargs))
+
+
+# Module-level cache of models already resolved to a local snapshot path
+_model_paths: Dict[str, str] = {}
+_model_lock = asyncio.Lock()
+
 
+async def _ensure_model_downloaded(model: str, max_workers: int = 8) -> str:
+    """
+    Fetch the model snapshot into the Hugging Face cache and return its local path.
+
+    snapshot_download pulls the repository files concurrently, streams each one
+    to an ``.incomplete`` file that is resumed on retry, verifies it against the
+    hub's checksum and only then moves it into place. Files already present in
+    the cache are not downloaded again.
+
+    Once a model has been resolved its path is cached for the life of the process,
+    so warm calls skip the cache probing entirely and concurrent first calls wait
+    on the lock instead of racing to download.
+    """
+    model_path = _model_paths.get(model)
+    if model_path is not None:
+        return model_path
+
+    async with _model_lock:
+        model_path = _model_paths.get(model)
+        if model_path is None:  # Double-check pattern
+            log.info("[local-tts] Ensuring model is available locally: %s", model)
+            model_path = await _run_io(
+                snapshot_download, repo_id=model, max_workers=max_workers
+            )
+            _model_paths[model] = model_path
+            log.info("[local-tts] Model available at %s", model_path)
+    return model_path
+
+
+# In-memory LRU of final audio bytes, bounded by SAM_TTS_CACHE_MB (0 disables)
+_TTS_CACHE: "OrderedDict[bytes, bytes]" = OrderedDict()
+_TTS_CACHE_BYTES = 0
+_TTS_CACHE_LIMIT = int(os.getenv("SAM_TTS_CACHE_MB", "256")) * (1 << 20)
+# Cache key -> [lock, number of holders/waiters] for single-flight synthesis
+_tts_inflight: Dict[bytes, List[Any]] = {}
+
+
+def _tts_cache_key(model: str, speaker_name: str, text_bytes: bytes) -> bytes:
+    """Build the audio cache key from the voice, model and UTF-8 encoded text."""
+    h = hashlib.blake2b(digest_size=16, key=speaker_name.encode())
+    h.update(model.encode())
+    h.update(b"\0")
+    h.update(text_bytes)
+    return h.digest()
+
+
+def _tts_cache_get(key: bytes) -> Optional[bytes]:
+    """Return cached audio for key and mark it most recently used, or None."""
+    audio = _TTS_CACHE.get(key)
+    if audio is not None:
+        _TTS_CACHE.move_to_end(key)
+    return audio
+
+
+def _tts_cache_put(key: bytes, audio: bytes) -> None:
+    """Cache audio under key, evicting least recently used entries over the budget."""
+    global _TTS_CACHE_BYTES
+    if len(audio) > _TTS_CACHE_LIMIT:
+        return
+    old = _TTS_CACHE.pop(key, None)
+    if old is not None:
+        _TTS_CACHE_BYTES -= len(old)
+    _TTS_CACHE[key] = audio
+    _TTS_CACHE_BYTES += len(audio)
+    while _TTS_CACHE_BYTES > _TTS_CACHE_LIMIT:
+        _, evicted = _TTS_CACHE.popitem(last=False)
+        _TTS_CACHE_BYTES -= len(evicted)
+
+
+@contextlib.asynccontextmanager
+async def _tts_single_flight(key: bytes) -> AsyncIterator[None]:
+    """Serialize work on one cache key; the lock is dropped once nobody holds it."""
+    entry = _tts_inflight.get(key)
+    if entry is None:
+        entry = _tts_inflight[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _tts_inflight[key]
+
+
+def _ctx_parts(tool_context: ToolContext) -> Tuple[str, str, str, Any]:
+    """
+    Extract app name, user ID, session ID and artifact service from a tool context.
+
+    Raises:
+        ValueError: If the invocation context or any of the parts is missing
+    """
     inv_context = tool_context._invocation_context
+    if not inv_context:
+        raise ValueError("InvocationContext is not available.")
+
     app_name = getattr(inv_context, "app_name", None)
     user_id = getattr(inv_context, "user_id", None)
     session_id = get_original_session_id(inv_context)
     artifact_service = getattr(inv_context, "artifact_service", None)
 
-    if not all([app_name, user_id, session_id, artifact_service]):
+    if not (app_name and user_id and session_id and artifact_service):
         missing_parts = [
             part
-            for part, val in [
+            for part, val in (
                 ("app_name", app_name),
                 ("user_id", user_id),
                 ("session_id", session_id),
                 ("artifact_service", artifact_service),
-            ]
+            )
             if not val
         ]
-        log.error(f"{log_identifier} Missing required context parts: {', '.join(missing_parts)}")
-        return {
-            "status": "error",
-            "message": f"Missing required context parts: {', '.join(missing_parts)}",
-        }
+        raise ValueError(f"Missing required context parts: {', '.join(missing_parts)}")
 
-    # Create temporary directory for processing
-    temp_dir = tempfile.mkdtemp(prefix="tts_")
-    temp_text_file = None
-    temp_wav_file = None
-    temp_mp3_file = None
+    return app_name, user_id, session_id, artifact_service
 
-    try:
-        # Write text to temporary file
-        temp_text_file = os.path.join(temp_dir, "input.txt")
-        with open(temp_text_file, 'w', encoding='utf-8') as f:
-            f.write(text)
 
-        log.info(f"{log_identifier} Created temporary text file: {temp_text_file}")
+async def _save_audio_artifact(
+    audio_bytes: bytes,
+    speaker_name: str,
+    text: str,
+    app_name: str,
+    user_id: str,
+    session_id: str,
+    artifact_service: Any,
+    tool_context: ToolContext,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Save generated MP3 audio as an artifact with TTS metadata.
 
-        # Determine paths
-        plugin_dir = os.path.dirname(os.path.abspath(__file__))
-        inference_script = os.path.join(plugin_dir, "realtime_model_inference_from_file.py")
+    audio_bytes is handed to the artifact service as-is; it comes straight from
+    ffmpeg's stdout, so no copy is made on the way.
 
-        # Prepare output path
-        temp_wav_file = os.path.join(temp_dir, "input_generated.wav")
-
-        # Build command to run TTS
-        # The script outputs to <output_dir>/<txt_filename>_generated.wav
-        cmd = [
-            "python",
-            inference_script,
-            "--model_path", "microsoft/VibeVoice-Realtime-0.5B",
-            "--txt_path", temp_text_file,
-            "--output_dir", temp_dir,
-            "--speaker_name", speaker_name,
-        ]
+    Returns:
+        Tuple of (artifact filename, save result from save_artifact_with_metadata)
+    """
+    # Generate filename; one timestamp serves the filename, metadata and artifact
+    timestamp = datetime.now(timezone.utc)
+    output_filename = f"tts_{speaker_name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.mp3"
+
+    metadata_dict = {
+        "description": "Text-to-speech audio generated by local-tts",
+        "source_tool": "text_to_speech",
+        "speaker": speaker_name,
+        "text_preview": text[:100] if len(text) > 100 else text,
+        "creation_timestamp_iso": timestamp.isoformat(),
+        "text_length": len(text),
+    }
+
+    log.info("[local-tts:text_to_speech] Saving MP3 artifact: %s", output_filename)
+
+    # TODO: save_artifact_with_metadata only accepts content_bytes (wrapped in an
+    # inline Part); upstream a path/stream variant to
+    # solace_agent_mesh.agent.utils.artifact_helpers so large audio can be moved
+    # into the artifact store without materializing it in memory.
+    save_result = await save_artifact_with_metadata(
+        artifact_service=artifact_service,
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=output_filename,
+        content_bytes=audio_bytes,
+        mime_type=_MP3_MIME_TYPE,
+        metadata_dict=metadata_dict,
+        timestamp=timestamp,
+        schema_max_keys=DEFAULT_SCHEMA_MAX_KEYS,
+        tool_context=tool_context,
+    )
+    return output_filename, save_result
 
-        log.info(f"{log_identifier} Running TTS command: {' '.join(cmd)}")
 
-        # Run TTS generation
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+async def text_to_speech(
+    text: str,
+    speaker_name: str = "Carter",
+    tool_context: Optional[ToolContext] = None,
+    tool_config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Converts text to speech using VibeVoice TTS and saves the output as an MP3 artifact.
 
-        if result.returncode != 0:
-            log.error(f"{log_identifier} TTS generation failed: {result.stderr}")
-            return {
-                "status": "error",
-                "message": f"TTS generation failed: {result.stderr}",
-            }
+    Args:
+        text: The text to convert to speech
+        speaker_name: The voice to use (Carter, Davis, Emma, or Grace). Default: Carter
+        tool_context: The tool context from Solace Agent Mesh
+        tool_config: Additional tool configuration:
+            - model: Hugging Face model to use (default: "microsoft/VibeVoice-Realtime-0.5B")
+            - max_concurrent_tts: Maximum syntheses running at once in this process
+              (default: SAM_TTS_CONCURRENCY, or half the CPU count); the first
+              value used applies to all tools
 
-        log.info(f"{log_identifier} TTS generation completed successfully")
+    Generated audio is kept in an in-memory LRU cache (SAM_TTS_CACHE_MB, default 256),
+    so repeating the same text and voice skips synthesis and only saves a
+    new artifact.
 
-        # Check if WAV file was created
-        if not os.path.exists(temp_wav_file):
-            log.error(f"{log_identifier} WAV file not found at {temp_wav_file}")
-            return {
-                "status": "error",
-                "message": "Generated WAV file not found",
-            }
+    Returns:
+        A dictionary with status, message, and artifact information
+    """
+    plugin_name = "local-tts"
+    log_identifier = f"[{plugin_name}:text_to_speech]"
 
-        # Convert WAV to MP3 using ffmpeg
-        temp_mp3_file = os.path.join(temp_dir, "output.mp3")
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-i", temp_wav_file,
-            "-codec:a", "libmp3lame",
-            "-qscale:a", "2",
-            "-y",  # Overwrite output file
-            temp_mp3_file
-        ]
+    # Validate speaker before doing any work
+    if speaker_name not in AVAILABLE_VOICES:
+        log.warning(
+            "%s Invalid speaker '%s' (known: %s), defaulting to Carter",
+            log_identifier, speaker_name, ', '.join(sorted(AVAILABLE_VOICES)),
+        )
+        speaker_name = "Carter"
 
-        log.info(f"{log_identifier} Converting WAV to MP3")
+    log.info(
+        "%s Converting text to speech with speaker: %s (language: %s)",
+        log_identifier, speaker_name, _VOICE_TO_LANG[speaker_name],
+    )
 
-        result = subprocess.run(
-            ffmpeg_cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+    # Validate tool context
+    if not tool_context or not tool_context._invocation_context:
+        log.error("%s ToolContext or InvocationContext is missing.", log_identifier)
+        return {
+            "status": "error",
+            "message": "ToolContext or InvocationContext is missing.",
+        }
+
+    try:
+        app_name, user_id, session_id, artifact_service = _ctx_parts(tool_context)
+    except ValueError as e:
+        log.error("%s %s", log_identifier, e)
+        return {
+            "status": "error",
+            "message": str(e),
+        }
+
+    current_tool_config = tool_config if tool_config is not None else {}
+    model = current_tool_config.get("model", DEFAULT_MODEL)
+    max_concurrent_setting = current_tool_config.get("max_concurrent_tts")
 
-        if result.returncode != 0:
-            log.error(f"{log_identifier} MP3 conversion failed: {result.stderr}")
+    max_concurrent_tts = None
+    if max_concurrent_setting is not None:
+        try:
+            # Via str() so floats and booleans are rejected rather than truncated
+            max_concurrent_tts = int(str(max_concurrent_setting))
+        except ValueError:
+            pass
+        if max_concurrent_tts is None or max_concurrent_tts < 1:
+            log.error("%s Invalid max_concurrent_tts: %s", log_identifier, max_concurrent_setting)
             return {
                 "status": "error",
-                "message": f"MP3 conversion failed: {result.stderr}",
+                "message": f"Invalid max_concurrent_tts '{max_concurrent_setting}'. Must be an integer of at least 1",
             }
 
-        log.info(f"{log_identifier} MP3 conversion completed successfully")
+    try:
+        model_path = await _ensure_model_downloaded(model)
+    except Exception as e:
+        log.error("%s Failed to download model %s: %s", log_identifier, model, e)
+        return {
+            "status": "error",
+            "message": f"Failed to download model {model}: {e}",
+        }
 
-        # Read MP3 file
-        with open(temp_mp3_file, 'rb') as f:
-            mp3_content = f.read()
+    # Encode once; the bytes feed both the cache key and the worker request
+    text_bytes = text.encode("utf-8")
+    log.info("%s Text: %d chars / %d bytes", log_identifier, len(text), len(text_bytes))
 
-        # Generate filename
-        timestamp = datetime.now(timezone.utc)
-        output_filename = f"tts_{speaker_name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.mp3"
+    # Prepare output path in the process-wide temporary directory
+    temp_wav_file = str(_TMP_DIR / f"out-{next(_TMP_COUNTER)}.wav")
 
-        # Save as artifact
-        metadata_dict = {
-            "description": f"Text-to-speech audio generated by {plugin_name}",
-            "source_tool": "text_to_speech",
-            "speaker": speaker_name,
-            "text_preview": text[:100] if len(text) > 100 else text,
-            "creation_timestamp_iso": timestamp.isoformat(),
-            "text_length": len(text),
-        }
-
-        log.info(f"{log_identifier} Saving MP3 artifact: {output_filename}")
+    try:
+        # Identical requests are served from the audio cache; concurrent misses
+        # for the same key wait for the first one instead of synthesizing twice
+        cache_key = _tts_cache_key(model, speaker_name, text_bytes)
+        async with _tts_single_flight(cache_key):
+            mp3_content = _tts_cache_get(cache_key)
+            if mp3_content is not None:
+                log.info("%s Using cached audio (%s bytes)", log_identifier, len(mp3_content))
+            else:
+                # Bound concurrent synthesis and transcoding across all callers
+                async with _get_semaphore(max_concurrent_tts):
+                    log.info("%s Running TTS generation", log_identifier)
+
+                    # Run TTS generation on the persistent worker
+                    result = await _get_worker(model_path).synthesize(
+                        text_bytes,
+                        speaker_name,
+                        temp_wav_file,
+                        timeout=300  # 5 minute timeout
+                    )
+
+                    if result.get("status") != "success":
+                        log.error("%s TTS generation failed: %s", log_identifier, result.get('message'))
+                        return {
+                            "status": "error",
+                            "message": f"TTS generation failed: {result.get('message')}",
+                        }
+
+                    log.info("%s TTS generation completed successfully", log_identifier)
+
+                    # Check if WAV file was created
+                    if not os.path.exists(temp_wav_file):
+                        log.error("%s WAV file not found at %s", log_identifier, temp_wav_file)
+                        return {
+                            "status": "error",
+                            "message": "Generated WAV file not found",
+                        }
+
+                    # Convert WAV to MP3 using ffmpeg, reading the MP3 back from stdout
+                    ffmpeg_cmd = [
+                        "ffmpeg",
+                        "-i", temp_wav_file,
+                        "-codec:a", "libmp3lame",
+                        "-qscale:a", "2",
+                        "-f", "mp3",
+                        "pipe:1"
+                    ]
+
+                    log.info("%s Converting WAV to MP3", log_identifier)
+
+                    returncode, mp3_content, stderr = await _run_process(ffmpeg_cmd, timeout=60)
+
+                    if returncode != 0:
+                        log.error("%s MP3 conversion failed: %s", log_identifier, stderr)
+                        return {
+                            "status": "error",
+                            "message": f"MP3 conversion failed: {stderr}",
+                        }
+
+                    log.info("%s MP3 conversion completed successfully", log_identifier)
+
+                _tts_cache_put(cache_key, mp3_content)
 
-        save_result = await save_artifact_with_metadata(
-            artifact_service=artifact_service,
+        # Save as artifact
+        output_filename, save_result = await _save_audio_artifact(
+            audio_bytes=mp3_content,
+            speaker_name=speaker_name,
+            text=text,
             app_name=app_name,
             user_id=user_id,
             session_id=session_id,
-            filename=output_filename,
-            content_bytes=mp3_content,
-            mime_type="audio/mpeg",
-            metadata_dict=metadata_dict,
-            timestamp=timestamp,
-            schema_max_keys=DEFAULT_SCHEMA_MAX_KEYS,
+            artifact_service=artifact_service,
             tool_context=tool_context,
         )
 
         if save_result.get("status") == "error":
-            log.error(f"{log_identifier} Failed to save artifact: {save_result.get('message')}")
+            log.error("%s Failed to save artifact: %s", log_identifier, save_result.get('message'))
             return {
                 "status": "error",
                 "message": f"Failed to save artifact: {save_result.get('message')}",
             }
 
-        log.info(f"{log_identifier} Artifact saved successfully: {output_filename} v{save_result['data_version']}")
+        log.info("%s Artifact saved successfully: %s v%s", log_identifier, output_filename, save_result['data_version'])
 
         return {
             "status": "success",
@@ -217,14 +587,14 @@ async def text_to_speech(
             "text_length": len(text),
         }
 
-    except subprocess.TimeoutExpired:
-        log.error(f"{log_identifier} TTS generation timed out")
+    except asyncio.TimeoutError:
+        log.error("%s TTS generation timed out", log_identifier)
         return {
             "status": "error",
             "message": "TTS generation timed out",
         }
     except Exception as e:
-        log.exception(f"{log_identifier} Unexpected error during TTS generation: {e}")
+        log.exception("%s Unexpected error during TTS generation: %s", log_identifier, e)
         return {
             "status": "error",
             "message": f"Unexpected error during TTS generation: {str(e)}",
@@ -232,14 +602,8 @@ async def text_to_speech(
     finally:
         # Cleanup temporary files
         try:
-            if temp_text_file and os.path.exists(temp_text_file):
-                os.remove(temp_text_file)
-            if temp_wav_file and os.path.exists(temp_wav_file):
+            if os.path.exists(temp_wav_file):
                 os.remove(temp_wav_file)
-            if temp_mp3_file and os.path.exists(temp_mp3_file):
-                os.remove(temp_mp3_file)
-            if os.path.exists(temp_dir):
-                os.rmdir(temp_dir)
-            log.info(f"{log_identifier} Cleaned up temporary files")
+            log.info("%s Cleaned up temporary files", log_identifier)
         except Exception as e:
-            log.warning(f"{log_identifier} Error cleaning up temporary files: {e}")
+            log.warning("%s Error cleaning up temporary files: %s", log_identifier, e)